@@ -5,6 +5,11 @@ from pathlib import Path
 
 
 def read_csv(path: Path):
+    if path.suffix == ".jsonl":
+        # Raw files (jsonl or compact) are summarized on the fly.
+        from run_benchmarks import load_records, summary_rows
+
+        return summary_rows(load_records(path))
     with path.open() as fh:
         return list(csv.DictReader(fh))
 
@@ -24,7 +29,7 @@ def write_csv(path: Path, rows):
 
 def main() -> int:
     p = argparse.ArgumentParser(description="Merge multiple node summaries")
-    p.add_argument("--input", action="append", required=True, help="node_name=path/to/summary.csv")
+    p.add_argument("--input", action="append", required=True, help="node_name=path/to/summary.csv (or raw .jsonl)")
     p.add_argument("--output", default="benchmarks/results/multi_node_summary.csv")
     args = p.parse_args()
 
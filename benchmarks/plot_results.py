@@ -5,6 +5,11 @@ from pathlib import Path
 
 
 def load_rows(summary_csv: Path):
+    if summary_csv.suffix == ".jsonl":
+        # Raw files (jsonl or compact) are summarized on the fly.
+        from run_benchmarks import load_records, summary_rows
+
+        return summary_rows(load_records(summary_csv))
     with summary_csv.open() as fh:
         return list(csv.DictReader(fh))
 
@@ -30,6 +35,8 @@ def plot_concurrency_vs_p95(rows, out_dir: Path):
     for r in rows:
         if r.get("scenario") != "concurrency":
             continue
+        if r.get("phase") == "warmup":
+            continue
         key = (r.get("function_type", ""), r.get("region", ""))
         by_key.setdefault(key, []).append(r)
 
@@ -55,6 +62,9 @@ def plot_rps_vs_errors(rows, out_dir: Path):
 
     by_key = {}
     for r in rows:
+        # Derived fan-out statistics (first/median/last/...) share one rps value per fan-out.
+        if r.get("scenario") == "fanout" and r.get("phase"):
+            continue
         key = (r.get("function_type", ""), r.get("region", ""), r.get("scenario", ""))
         by_key.setdefault(key, []).append(r)
 
@@ -77,7 +87,7 @@ def plot_rps_vs_errors(rows, out_dir: Path):
 
 def main() -> int:
     p = argparse.ArgumentParser(description="Plot benchmark outputs")
-    p.add_argument("summary_csv", help="Path to summary.csv")
+    p.add_argument("summary_csv", help="Path to summary.csv or a raw .jsonl file")
     p.add_argument("--output-dir", default="benchmarks/plots")
     args = p.parse_args()
 
@@ -2,17 +2,20 @@
 import argparse
 import asyncio
 import csv
+import heapq
 import json
 import os
 import random
 import shlex
 import statistics
+import sys
 import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
 
 
 DATASET_ID = "ivo://auth.example.org/datasets/fits?testing/5b/f5/PTF10tce.fits"
@@ -20,6 +23,26 @@ CIRCLE = "351.986728 8.778684 0.01"
 RESPONSE_FORMAT = "application/fits"
 LOCAL_SOURCE_URL = "https://gitlab.com/manuparra/test-data-faas/-/raw/main/PTF10tce.fits?inline=false"
 
+# Connection handling per transport mode:
+#   fresh      one curl process per request (new TCP + full TLS handshake)
+#   keepalive  one curl process, HTTP/1.1 connection reused across requests
+#   http2      one curl process, requests multiplexed as HTTP/2 streams
+#   tls_resume one curl process, new TCP per request but TLS session resumed
+TRANSPORT_MODES = ("fresh", "keepalive", "http2", "tls_resume")
+TRANSPORT_CURL_FLAGS = {
+    "fresh": ["--http1.1"],
+    "keepalive": ["--http1.1"],
+    "http2": ["--http2", "--parallel"],
+    "tls_resume": ["--http1.1", "-H", "Connection: close"],
+}
+# Negotiated %{http_version} each mode must report to be a valid measurement.
+TRANSPORT_HTTP_VERSIONS = {
+    "fresh": "1.1",
+    "keepalive": "1.1",
+    "http2": "2",
+    "tls_resume": "1.1",
+}
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -38,6 +61,198 @@ def percentile(values: List[float], q: float) -> Optional[float]:
     return ordered[lo] * (1 - frac) + ordered[hi] * frac
 
 
+def mser_truncation(values: List[float], batch_size: int = 5) -> int:
+    """Return how many leading samples to drop so the remaining series is steady (MSER-m).
+
+    Samples are grouped into batch means and the truncation point minimising
+    ``var(tail) / len(tail)`` is searched over the first half of the series.
+    """
+    n_batches = len(values) // batch_size
+    if n_batches < 3:
+        return 0
+    means = [statistics.fmean(values[i * batch_size:(i + 1) * batch_size]) for i in range(n_batches)]
+
+    # Suffix sums let every candidate truncation be scored in O(1).
+    suffix_sum = [0.0] * (n_batches + 1)
+    suffix_sq = [0.0] * (n_batches + 1)
+    for i in range(n_batches - 1, -1, -1):
+        suffix_sum[i] = suffix_sum[i + 1] + means[i]
+        suffix_sq[i] = suffix_sq[i + 1] + means[i] * means[i]
+
+    best_d = 0
+    best_stat = None
+    for d in range((n_batches + 1) // 2):
+        k = n_batches - d
+        sse = suffix_sq[d] - suffix_sum[d] * suffix_sum[d] / k
+        stat = sse / (k * k)
+        if best_stat is None or stat < best_stat:
+            best_d = d
+            best_stat = stat
+    return best_d * batch_size
+
+
+def tag_warmup(records: List[Dict[str, Any]], method: str) -> List[Dict[str, Any]]:
+    """Tag concurrency records in place as warm-up or steady state, one time series per cell.
+
+    A cell is one (scenario, function_type, region, concurrency) combination. Tagging
+    is idempotent, so raw files from any run can be re-analysed. Returns the
+    per-cell warm-up cutoff (``ts_start`` of the first steady-state request).
+    """
+    if method == "none":
+        return []
+    cells: Dict[tuple, List[Dict[str, Any]]] = {}
+    for r in records:
+        if r.get("scenario") != "concurrency":
+            continue
+        key = (r.get("scenario", ""), r.get("function_type", ""), r.get("region", ""), int(r.get("concurrency", 1)))
+        cells.setdefault(key, []).append(r)
+
+    cutoffs = []
+    for key, cell in cells.items():
+        series = sorted((r for r in cell if r.get("success")), key=lambda r: r["ts_start"])
+        cut = mser_truncation([float(r["duration_s"]) for r in series])
+        cutoff_ts = series[cut]["ts_start"] if cut else None
+        warmup = 0
+        for r in cell:
+            is_warmup = cutoff_ts is not None and r["ts_start"] < cutoff_ts
+            r["warmup"] = is_warmup
+            r["phase"] = "warmup" if is_warmup else "steady"
+            warmup += int(is_warmup)
+        cutoffs.append(
+            {
+                "scenario": key[0],
+                "function_type": key[1],
+                "region": key[2],
+                "concurrency": key[3],
+                "method": method,
+                "cutoff_ts_start": cutoff_ts,
+                "warmup_requests": warmup,
+                "steady_requests": len(cell) - warmup,
+            }
+        )
+    return cutoffs
+
+
+COMPACT_FORMAT = "srcnet-raw-compact/1"
+# Fields that are constant for a target/scenario cell and stored once per group header.
+COMPACT_CONST_KEYS = (
+    "scenario",
+    "phase",
+    "warmup",
+    "transport",
+    "function_type",
+    "region",
+    "url",
+    "concurrency",
+    "idle_minutes",
+)
+# Fields dropped from compact rows when empty and restored by load_records().
+COMPACT_DEFAULTS: Dict[str, Any] = {"error": None, "stderr": "", "stdout_sample": ""}
+
+
+class JsonlRecordWriter:
+    """One self-contained JSON object per request (the original raw.jsonl layout)."""
+
+    def __init__(self, fh):
+        self.fh = fh
+
+    def write_record(self, rec: Dict[str, Any]) -> None:
+        self.fh.write(json.dumps(rec) + "\n")
+
+
+class CompactRecordWriter:
+    """Raw records with per-cell constants written once.
+
+    Layout (one JSON value per line):
+      {"format": COMPACT_FORMAT}                                   file header
+      {"group": 0, "const": {...}, "cmd": "...", "fields": [...]}  group header
+      [0, 1771969060.670179, 1771969063.577222, ...]               request row
+
+    ``timestamp`` (taken at completion) is derived from ``ts_end`` and ``cmd`` is
+    stored once per group; empty ``error``/``stderr``/``stdout_sample`` values are omitted.
+    """
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.groups: Dict[tuple, int] = {}
+        self.fh.write(json.dumps({"format": COMPACT_FORMAT}) + "\n")
+
+    def write_record(self, rec: Dict[str, Any]) -> None:
+        const = {k: rec[k] for k in COMPACT_CONST_KEYS if k in rec}
+        fields = [
+            k
+            for k in rec
+            if k not in const
+            and k not in ("timestamp", "cmd")
+            and not (k in COMPACT_DEFAULTS and rec[k] == COMPACT_DEFAULTS[k])
+        ]
+        cmd = rec.get("cmd", "")
+        # cmd is part of the key so files with per-request commands still round-trip.
+        key = (tuple(sorted(const.items())), cmd, tuple(fields))
+        gid = self.groups.get(key)
+        if gid is None:
+            gid = len(self.groups)
+            self.groups[key] = gid
+            header = {"group": gid, "const": const, "cmd": cmd, "fields": fields}
+            self.fh.write(json.dumps(header) + "\n")
+
+        row: List[Any] = [gid]
+        for k in fields:
+            v = rec[k]
+            if k == "http_code" and str(v).isdigit():
+                v = int(v)
+            elif isinstance(v, float):
+                v = round(v, 6)
+            row.append(v)
+        self.fh.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+
+RAW_WRITERS = {"jsonl": JsonlRecordWriter, "compact": CompactRecordWriter}
+RAW_FILENAMES = {"jsonl": "raw.jsonl", "compact": "raw.compact.jsonl"}
+
+
+def load_records(raw_path: Path) -> List[Dict[str, Any]]:
+    """Read raw records from either the jsonl or the compact layout."""
+    records: List[Dict[str, Any]] = []
+    groups: Dict[int, Dict[str, Any]] = {}
+    compact = False
+    with raw_path.open() as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if isinstance(item, dict) and item.get("format") == COMPACT_FORMAT:
+                compact = True
+            elif compact and isinstance(item, dict):
+                groups[item["group"]] = item
+            elif compact:
+                group = groups[item[0]]
+                rec = dict(COMPACT_DEFAULTS)
+                rec.update(zip(group["fields"], item[1:]))
+                rec.update(group["const"])
+                if isinstance(rec.get("http_code"), int):
+                    rec["http_code"] = f"{rec['http_code']:03d}"
+                rec["timestamp"] = datetime.fromtimestamp(rec["ts_end"], timezone.utc).isoformat()
+                rec["cmd"] = group["cmd"]
+                records.append(rec)
+            else:
+                records.append(item)
+    return records
+
+
+def _safe_cmd(cmd: List[str]) -> str:
+    safe_cmd_parts = list(cmd)
+    for i, part in enumerate(safe_cmd_parts):
+        if part == "-H" and i + 1 < len(safe_cmd_parts):
+            header = safe_cmd_parts[i + 1]
+            if header.startswith("Authorization: Bearer "):
+                safe_cmd_parts[i + 1] = "Authorization: Bearer <REDACTED>"
+        # Temporary output files are per-request; keep cmd constant for a target.
+        if part == "-o" and i + 1 < len(safe_cmd_parts) and safe_cmd_parts[i + 1] != "/dev/null":
+            safe_cmd_parts[i + 1] = "<OUTPUT>"
+    return " ".join(shlex.quote(x) for x in safe_cmd_parts) + " <URL>"
+
+
 @dataclass
 class EndpointTarget:
     function_type: str
@@ -187,13 +402,6 @@ class CurlInvoker:
         if not success:
             error = stderr_s.strip() or f"http_code={http_code}"
 
-        safe_cmd_parts = list(cmd[:-1])
-        for i, part in enumerate(safe_cmd_parts):
-            if part == "-H" and i + 1 < len(safe_cmd_parts):
-                header = safe_cmd_parts[i + 1]
-                if header.startswith("Authorization: Bearer "):
-                    safe_cmd_parts[i + 1] = "Authorization: Bearer <REDACTED>"
-
         return {
             "ts_start": started,
             "ts_end": finished,
@@ -208,9 +416,172 @@ class CurlInvoker:
             "error": error,
             "stderr": stderr_s.strip(),
             "stdout_sample": stdout_s[:200],
-            "cmd": " ".join(shlex.quote(x) for x in safe_cmd_parts) + " <URL>",
+            "cmd": _safe_cmd(cmd[:-1]),
         }
 
+    def _request_url(self, target: EndpointTarget) -> str:
+        if target.function_type != "cpu_data":
+            return target.url
+        params = target.request_params or {
+            "ID": DATASET_ID,
+            "CIRCLE": CIRCLE,
+            "RESPONSE_FORMAT": RESPONSE_FORMAT,
+        }
+        sep = "&" if "?" in target.url else "?"
+        return target.url + sep + urlencode(params)
+
+    async def invoke_batch(self, target: EndpointTarget, mode: str, count: int, streams: int = 10) -> List[Dict[str, Any]]:
+        """Send ``count`` requests from a single curl process using the given transport mode.
+
+        Each transfer reports its own connect/TLS/first-byte timings so connection
+        setup can be separated from server time. The local FITS prefetch is not
+        performed here: this scenario isolates transport cost.
+
+        ``fresh`` runs one curl process per request so nothing is shared between them.
+        Records whose negotiated HTTP version differs from the mode's (e.g. ``http2``
+        against an HTTP/1.1-only server) get ``protocol_ok: false``.
+        """
+        if mode == "fresh" and count > 1:
+            records = []
+            for _ in range(count):
+                records.extend(await self.invoke_batch(target, mode, 1, streams=streams))
+            return records
+
+        streams = min(streams, count)
+        cmd = [
+            "curl",
+            "-s",
+            "-k",
+            "-w",
+            "__CURL_META__ %{http_code} %{time_total} %{size_download} "
+            "%{time_connect} %{time_appconnect} %{time_starttransfer} %{num_connects} %{http_version}\n",
+        ]
+        cmd.extend(TRANSPORT_CURL_FLAGS[mode])
+        if mode == "http2":
+            cmd.extend(["--parallel-max", str(streams)])
+        if target.auth_required:
+            cmd.extend(["-H", f"Authorization: Bearer {self.ska_token}"])
+
+        url = self._request_url(target)
+        base_len = len(cmd)
+        output_files = []
+        for _ in range(count):
+            if target.function_type == "cpu_data":
+                output_file = self.tmp_dir / f"{target.region}_{uuid.uuid4().hex}.fits"
+                output_files.append(output_file)
+                cmd.extend(["-o", str(output_file), url])
+            else:
+                cmd.extend(["-o", "/dev/null", url])
+
+        started = time.time()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        finished = time.time()
+
+        for output_file in output_files:
+            if output_file.exists():
+                try:
+                    output_file.unlink()
+                except OSError:
+                    pass
+
+        stderr_s = stderr.decode("utf-8", errors="replace").strip()
+        # Record the per-request "-o <file> <URL>" pair once with a repeat count.
+        safe_cmd = _safe_cmd(cmd[:base_len] + ["-o", str(output_files[0]) if output_files else "/dev/null"])
+        if count > 1:
+            safe_cmd += f" x {count}"
+        metas = []
+        for line in stdout.decode("utf-8", errors="replace").splitlines():
+            if "__CURL_META__" not in line:
+                continue
+            parts = line.split("__CURL_META__", 1)[1].split()
+            if len(parts) < 8:
+                continue
+            try:
+                metas.append(
+                    {
+                        "http_code": parts[0],
+                        "time_total": float(parts[1]),
+                        "bytes": int(float(parts[2])),
+                        "time_connect": float(parts[3]),
+                        "time_appconnect": float(parts[4]),
+                        "time_starttransfer": float(parts[5]),
+                        "num_connects": int(parts[6]),
+                        "http_version": parts[7],
+                    }
+                )
+            except ValueError:
+                continue
+
+        records = []
+        offset = started
+        # curl reports transfers as they finish. With --parallel, transfers beyond
+        # --parallel-max wait for a free slot, so each one (in completion order) is
+        # assumed to start when the earliest busy slot frees up.
+        slots = [started] * streams
+        for i in range(count):
+            meta = metas[i] if i < len(metas) else None
+            if meta is None:
+                records.append(
+                    {
+                        "ts_start": started,
+                        "ts_end": finished,
+                        "timestamp": utc_now_iso(),
+                        "duration_s": finished - started,
+                        "request_duration_s": finished - started,
+                        "prefetch_duration_s": 0.0,
+                        "http_code": "000",
+                        "bytes": 0,
+                        "curl_rc": proc.returncode,
+                        "success": False,
+                        "error": stderr_s or "missing_transfer_meta",
+                        "stderr": stderr_s,
+                        "stdout_sample": "",
+                        "cmd": safe_cmd,
+                    }
+                )
+                continue
+
+            total = meta["time_total"]
+            if mode == "http2":
+                ts_start = heapq.heappop(slots)
+                heapq.heappush(slots, ts_start + total)
+            else:
+                ts_start = offset
+            setup = max(meta["time_connect"], meta["time_appconnect"])
+            success = meta["http_code"].startswith(("2", "3"))
+            records.append(
+                {
+                    "ts_start": ts_start,
+                    "ts_end": ts_start + total,
+                    "timestamp": datetime.fromtimestamp(ts_start + total, timezone.utc).isoformat(),
+                    "duration_s": total,
+                    "request_duration_s": total,
+                    "prefetch_duration_s": 0.0,
+                    "http_code": meta["http_code"],
+                    "bytes": meta["bytes"],
+                    "curl_rc": proc.returncode,
+                    "success": success,
+                    "error": None if success else (stderr_s or f"http_code={meta['http_code']}"),
+                    "stderr": stderr_s,
+                    "stdout_sample": "",
+                    "cmd": safe_cmd,
+                    "connect_s": meta["time_connect"],
+                    "tls_s": max(0.0, meta["time_appconnect"] - meta["time_connect"]) if meta["time_appconnect"] else 0.0,
+                    "setup_s": setup,
+                    "server_s": max(0.0, meta["time_starttransfer"] - setup),
+                    "num_connects": meta["num_connects"],
+                    "http_version": meta["http_version"],
+                    "protocol_ok": meta["http_version"] == TRANSPORT_HTTP_VERSIONS[mode],
+                }
+            )
+            offset += total
+        return records
+
 
 def load_targets(config_path: Path) -> List[EndpointTarget]:
     data = json.loads(config_path.read_text())
@@ -256,7 +627,7 @@ async def run_baseline(
                 "request_id": req,
             }
         )
-        sink.write(json.dumps(rec) + "\n")
+        sink.write_record(rec)
         req += 1
         await asyncio.sleep(random.uniform(interval_min, interval_max))
     return req
@@ -285,12 +656,18 @@ async def _worker_loop(
                 "request_id": count,
             }
         )
-        sink.write(json.dumps(rec) + "\n")
+        sink.write_record(rec)
         count += 1
     return count
 
 
-async def run_concurrency(invoker: CurlInvoker, target: EndpointTarget, concurrency: int, duration_sec: int, sink) -> int:
+async def run_concurrency(
+    invoker: CurlInvoker,
+    target: EndpointTarget,
+    concurrency: int,
+    duration_sec: int,
+    sink,
+) -> int:
     stop_at = time.time() + duration_sec
     tasks = [
         asyncio.create_task(
@@ -337,7 +714,7 @@ async def run_cold_warm(
                 "request_id": total,
             }
         )
-        sink.write(json.dumps(rec) + "\n")
+        sink.write_record(rec)
         total += 1
         await asyncio.sleep(warm_interval_sec)
 
@@ -359,24 +736,386 @@ async def run_cold_warm(
                     "request_id": i,
                 }
             )
-            sink.write(json.dumps(rec) + "\n")
+            sink.write_record(rec)
             total += 1
     return total
 
 
-def summarize(records: List[Dict[str, Any]], output_dir: Path) -> Path:
+async def run_transport(
+    invoker: CurlInvoker,
+    target: EndpointTarget,
+    modes: List[str],
+    requests_per_mode: int,
+    streams: int,
+    sink,
+) -> int:
+    total = 0
+    for mode in modes:
+        recs = await invoker.invoke_batch(target, mode, requests_per_mode, streams=streams)
+        for i, rec in enumerate(recs):
+            rec.update(
+                {
+                    "scenario": "transport",
+                    "phase": mode,
+                    "transport": mode,
+                    "function_type": target.function_type,
+                    "region": target.region,
+                    "url": target.url,
+                    "concurrency": min(streams, requests_per_mode) if mode == "http2" else 1,
+                    "worker_id": 0,
+                    "request_id": i,
+                }
+            )
+            sink.write_record(rec)
+        total += len(recs)
+    return total
+
+
+async def run_fanout(
+    invoker: CurlInvoker,
+    targets: List[EndpointTarget],
+    duration_sec: int,
+    interval_min: float,
+    interval_max: float,
+    sink,
+) -> int:
+    """Send each logical request to all ``targets`` at once; one record per region and fan-out."""
+    deadline = time.time() + duration_sec
+    fanout_id = 0
+    total = 0
+    while time.time() < deadline:
+        recs = await asyncio.gather(*(invoker.invoke(t) for t in targets))
+        for worker_id, (target, rec) in enumerate(zip(targets, recs)):
+            rec.update(
+                {
+                    "scenario": "fanout",
+                    "function_type": target.function_type,
+                    "region": target.region,
+                    "url": target.url,
+                    "concurrency": len(targets),
+                    "worker_id": worker_id,
+                    "request_id": fanout_id,
+                    "fanout_id": fanout_id,
+                }
+            )
+            sink.write_record(rec)
+        total += len(recs)
+        fanout_id += 1
+        await asyncio.sleep(random.uniform(interval_min, interval_max))
+    return total
+
+
+def fanout_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Derive per-fan-out order statistics (first, median, last, first N of M) from fan-out records.
+
+    A statistic only succeeds if enough regions answered successfully: ``first_N_of_M``
+    needs N successes, ``median`` and ``last`` need all M.
+    """
+    grouped: Dict[tuple, List[Dict[str, Any]]] = {}
+    for r in records:
+        if r.get("scenario") == "fanout" and "fanout_id" in r:
+            grouped.setdefault((r.get("function_type", ""), int(r["fanout_id"])), []).append(r)
+
+    out = []
+    for (function_type, _), sample in grouped.items():
+        m = len(sample)
+        durations = sorted(float(x["duration_s"]) for x in sample if x.get("success"))
+        base = {
+            "scenario": "fanout",
+            "function_type": function_type,
+            "region": "+".join(sorted(x.get("region", "") for x in sample)),
+            "concurrency": m,
+            "ts_start": min(x["ts_start"] for x in sample),
+            "ts_end": max(x["ts_end"] for x in sample),
+        }
+        stats = [("median", statistics.median(durations) if len(durations) == m else None)]
+        for n in range(1, m + 1):
+            name = "first" if n == 1 else "last" if n == m else f"first_{n}_of_{m}"
+            stats.append((name, durations[n - 1] if len(durations) >= n else None))
+        for name, value in stats:
+            rec = dict(base)
+            rec.update({"phase": name, "success": value is not None, "duration_s": value or 0.0})
+            out.append(rec)
+    return out
+
+
+class ResourceSampler:
+    """Periodically sample CPU, RSS, I/O and context switches of a process tree or cgroup v2.
+
+    Only meaningful when the server runs on this host (the ``local`` region).
+    With a PID, the process and all its descendants are sampled. Per-process and
+    per-thread counters are accumulated as positive increments so processes or
+    threads exiting between samples never make a cumulative counter go down.
+    Usage of short-lived children that exit between two samples is missed; use
+    a cgroup for fork-per-request servers.
+    """
+
+    def __init__(self, sink, interval_sec: float, pid: Optional[int] = None, cgroup: Optional[Path] = None):
+        if (pid is None) == (cgroup is None):
+            raise ValueError("ResourceSampler needs exactly one of pid or cgroup")
+        self.sink = sink
+        self.interval_sec = interval_sec
+        self.pid = pid
+        self.cgroup = cgroup
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self._last: Dict[str, Dict[int, int]] = {}
+        self._totals: Dict[str, int] = {}
+
+    @staticmethod
+    def _read_kv(path: Path) -> Dict[str, str]:
+        out = {}
+        try:
+            for line in path.read_text().splitlines():
+                parts = line.replace(":", " ").split()
+                if len(parts) >= 2:
+                    out[parts[0]] = parts[1]
+        except OSError:
+            pass
+        return out
+
+    @staticmethod
+    def _stat_fields(pid: int) -> List[str]:
+        # Fields after the parenthesised comm: [0] state, [1] ppid, [11] utime, [12] stime.
+        return Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+
+    def _accumulate(self, counter: str, values: Dict[int, int]) -> int:
+        """Add per-id increments since the previous sample to a running total for ``counter``."""
+        last = self._last.get(counter, {})
+        total = self._totals.get(counter, 0)
+        for ident, value in values.items():
+            prev = last.get(ident)
+            # New ids (or reused ids whose counter restarted) contribute their full value.
+            total += value if prev is None or value < prev else value - prev
+        self._last[counter] = values
+        self._totals[counter] = total
+        return total
+
+    def _pids(self) -> List[int]:
+        if self.cgroup is not None:
+            try:
+                return [int(x) for x in (self.cgroup / "cgroup.procs").read_text().split()]
+            except OSError:
+                return []
+
+        children: Dict[int, List[int]] = {}
+        for stat in Path("/proc").glob("[0-9]*/stat"):
+            try:
+                ppid = int(self._stat_fields(int(stat.parent.name))[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(stat.parent.name))
+        tree = []
+        stack = [self.pid]
+        while stack:
+            pid = stack.pop()
+            tree.append(pid)
+            stack.extend(children.get(pid, []))
+        return tree
+
+    def _ctx_switches(self, pids: List[int]) -> Dict[str, int]:
+        voluntary: Dict[int, int] = {}
+        involuntary: Dict[int, int] = {}
+        for pid in pids:
+            for status in Path(f"/proc/{pid}/task").glob("*/status"):
+                kv = self._read_kv(status)
+                if not kv:
+                    continue
+                tid = int(status.parent.name)
+                voluntary[tid] = int(kv.get("voluntary_ctxt_switches", 0))
+                involuntary[tid] = int(kv.get("nonvoluntary_ctxt_switches", 0))
+        return {
+            "ctx_voluntary": self._accumulate("ctx_voluntary", voluntary),
+            "ctx_involuntary": self._accumulate("ctx_involuntary", involuntary),
+        }
+
+    def _sample_pid(self, pids: List[int]) -> Dict[str, Any]:
+        # Fails with OSError when the root process is gone.
+        self._stat_fields(self.pid)
+        cpu_ticks: Dict[int, int] = {}
+        read_bytes: Dict[int, int] = {}
+        write_bytes: Dict[int, int] = {}
+        rss_bytes = 0
+        for pid in pids:
+            try:
+                fields = self._stat_fields(pid)
+            except (OSError, IndexError):
+                continue
+            cpu_ticks[pid] = int(fields[11]) + int(fields[12])
+            rss_bytes += int(self._read_kv(Path(f"/proc/{pid}/status")).get("VmRSS", 0)) * 1024
+            io = self._read_kv(Path(f"/proc/{pid}/io"))
+            if "read_bytes" in io:
+                read_bytes[pid] = int(io["read_bytes"])
+                write_bytes[pid] = int(io["write_bytes"])
+        return {
+            "cpu_s": self._accumulate("cpu_ticks", cpu_ticks) / self.clk_tck,
+            "rss_bytes": rss_bytes,
+            "read_bytes": self._accumulate("read_bytes", read_bytes) if read_bytes else None,
+            "write_bytes": self._accumulate("write_bytes", write_bytes) if write_bytes else None,
+            "processes": len(cpu_ticks),
+        }
+
+    def _sample_cgroup(self, pids: List[int]) -> Dict[str, Any]:
+        cpu = self._read_kv(self.cgroup / "cpu.stat")
+        read_bytes = 0
+        write_bytes = 0
+        try:
+            for line in (self.cgroup / "io.stat").read_text().splitlines():
+                for item in line.split()[1:]:
+                    key, _, value = item.partition("=")
+                    if key == "rbytes":
+                        read_bytes += int(value)
+                    elif key == "wbytes":
+                        write_bytes += int(value)
+        except OSError:
+            pass
+        try:
+            rss_bytes = int((self.cgroup / "memory.current").read_text().strip())
+        except (OSError, ValueError):
+            rss_bytes = 0
+        return {
+            "cpu_s": int(cpu.get("usage_usec", 0)) / 1e6,
+            "rss_bytes": rss_bytes,
+            "read_bytes": read_bytes,
+            "write_bytes": write_bytes,
+            "processes": len(pids),
+        }
+
+    def sample(self) -> Optional[Dict[str, Any]]:
+        ts = time.time()
+        pids = self._pids()
+        try:
+            rec = self._sample_cgroup(pids) if self.cgroup is not None else self._sample_pid(pids)
+        except (OSError, IndexError, ValueError):
+            return None
+        rec.update(self._ctx_switches(pids))
+        rec["ts"] = ts
+        return rec
+
+    async def run(self) -> None:
+        while True:
+            # Walking /proc can take a while on busy hosts; keep it off the event loop.
+            rec = await asyncio.to_thread(self.sample)
+            if rec is not None:
+                self.sink.write(json.dumps(rec) + "\n")
+                self.sink.flush()
+            await asyncio.sleep(self.interval_sec)
+
+
+def summary_key(r: Dict[str, Any]) -> tuple:
+    """Summary cell of a record: (scenario, phase, function_type, region, concurrency, idle_minutes)."""
+    return (
+        r.get("scenario", ""),
+        r.get("phase", ""),
+        r.get("function_type", ""),
+        r.get("region", ""),
+        int(r.get("concurrency", 1)),
+        int(r.get("idle_minutes", 0)),
+    )
+
+
+def load_resource_samples(path: Path) -> List[Dict[str, Any]]:
+    samples = []
+    with path.open() as fh:
+        for line in fh:
+            if line.strip():
+                samples.append(json.loads(line))
+    return samples
+
+
+def resource_rows(records: List[Dict[str, Any]], samples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Server resource usage per local summary cell, from the samples falling inside each cell's time window.
+
+    Concurrency cells are grouped per level regardless of warm-up tags: warm-up and
+    steady-state requests interleave across workers, so their time windows overlap
+    and splitting them would count the same CPU time twice.
+    """
+    grouped: Dict[tuple, List[Dict[str, Any]]] = {}
+    for r in records:
+        # The sampler watches a process on this host, so only the local target is attributed.
+        if r.get("region") != "local":
+            continue
+        key = summary_key(r)
+        if key[0] == "concurrency":
+            key = key[:1] + ("",) + key[2:]
+        grouped.setdefault(key, []).append(r)
+
+    samples = sorted(samples, key=lambda x: x["ts"])
     rows = []
+    for key, sample in grouped.items():
+        start = min(x["ts_start"] for x in sample)
+        end = max(x["ts_end"] for x in sample)
+        window = [x for x in samples if start <= x["ts"] <= end]
+        if len(window) < 2:
+            continue
+        first, last = window[0], window[-1]
+        elapsed = last["ts"] - first["ts"]
+        cpu_s = last["cpu_s"] - first["cpu_s"]
+        # Scale the sampled CPU time to the whole cell window before dividing by requests.
+        cell_cpu_s = cpu_s * (end - start) / elapsed if elapsed > 0 else cpu_s
+
+        def delta(field: str) -> Optional[int]:
+            if first.get(field) is None or last.get(field) is None:
+                return None
+            return last[field] - first[field]
+
+        rows.append(
+            {
+                "scenario": key[0],
+                "phase": key[1],
+                "function_type": key[2],
+                "region": key[3],
+                "concurrency": key[4],
+                "idle_minutes": key[5],
+                "requests": len(sample),
+                "samples": len(window),
+                "cpu_util": round(cpu_s / elapsed, 4) if elapsed > 0 else 0.0,
+                "cpu_s_per_request": round(cell_cpu_s / len(sample), 6),
+                "rss_max_bytes": max(x["rss_bytes"] for x in window),
+                "read_bytes": delta("read_bytes"),
+                "write_bytes": delta("write_bytes"),
+                "ctx_voluntary": delta("ctx_voluntary"),
+                "ctx_involuntary": delta("ctx_involuntary"),
+            }
+        )
+    return rows
+
+
+def transport_rows(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Side-by-side latency split (connection setup vs server) for the transport scenario."""
     grouped: Dict[tuple, List[Dict[str, Any]]] = {}
     for r in records:
-        key = (
-            r.get("scenario", ""),
-            r.get("phase", ""),
-            r.get("function_type", ""),
-            r.get("region", ""),
-            int(r.get("concurrency", 1)),
-            int(r.get("idle_minutes", 0)),
+        if r.get("scenario") != "transport" or not r.get("success"):
+            continue
+        grouped.setdefault((r.get("function_type", ""), r.get("region", ""), r.get("transport", "")), []).append(r)
+
+    rows = []
+    for (function_type, region, mode), sample in grouped.items():
+        rows.append(
+            {
+                "function_type": function_type,
+                "region": region,
+                "transport": mode,
+                "requests": len(sample),
+                "p50_s": percentile([float(x["duration_s"]) for x in sample], 0.50) or 0.0,
+                "p95_s": percentile([float(x["duration_s"]) for x in sample], 0.95) or 0.0,
+                "setup_p50_s": percentile([float(x.get("setup_s", 0.0)) for x in sample], 0.50) or 0.0,
+                "server_p50_s": percentile([float(x.get("server_s", 0.0)) for x in sample], 0.50) or 0.0,
+                "connects": sum(int(x.get("num_connects", 0)) for x in sample),
+                "http_version": "/".join(sorted({str(x.get("http_version", "?")) for x in sample})),
+                "protocol_ok": all(x.get("protocol_ok", False) for x in sample),
+            }
         )
-        grouped.setdefault(key, []).append(r)
+    order = {m: i for i, m in enumerate(TRANSPORT_MODES)}
+    rows.sort(key=lambda x: (x["function_type"], x["region"], order.get(x["transport"], len(order))))
+    return rows
+
+
+def summary_rows(records: List[Dict[str, Any]], warmup_detection: str = "mser5") -> List[Dict[str, Any]]:
+    tag_warmup(records, warmup_detection)
+    rows = []
+    grouped: Dict[tuple, List[Dict[str, Any]]] = {}
+    for r in records + fanout_records(records):
+        grouped.setdefault(summary_key(r), []).append(r)
 
     for key, sample in grouped.items():
         durations = [float(x["duration_s"]) for x in sample if x.get("success")]
@@ -406,6 +1145,22 @@ def summarize(records: List[Dict[str, Any]], output_dir: Path) -> Path:
                 "mean_s": round(statistics.fmean(durations), 6) if durations else 0.0,
             }
         )
+    return rows
+
+
+def summarize(
+    records: List[Dict[str, Any]],
+    output_dir: Path,
+    resource_samples: Optional[List[Dict[str, Any]]] = None,
+    warmup_detection: str = "mser5",
+) -> Path:
+    rows = summary_rows(records, warmup_detection)
+    resources = resource_rows(records, resource_samples) if resource_samples else []
+    if resources:
+        with (output_dir / "resources_summary.csv").open("w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(resources[0].keys()))
+            writer.writeheader()
+            writer.writerows(resources)
 
     summary_csv = output_dir / "summary.csv"
     with summary_csv.open("w", newline="") as fh:
@@ -447,6 +1202,74 @@ def summarize(records: List[Dict[str, Any]], output_dir: Path) -> Path:
                 delta = c["p95_s"] - w["p95_s"]
                 fh.write(f"| {key[0]} | {key[1]} | {idle} | {delta:.6f} |\n")
 
+            fh.write("\n## Concurrency warm-up vs steady state\n\n")
+            warmup = {}
+            steady = {}
+            for row in rows:
+                key = (row["function_type"], row["region"], row["concurrency"])
+                if row["scenario"] == "concurrency" and row["phase"] == "warmup":
+                    warmup[key] = row
+                if row["scenario"] == "concurrency" and row["phase"] == "steady":
+                    steady[key] = row
+            fh.write("| function_type | region | concurrency | warmup_requests | steady_requests | warmup_p95_s | steady_p50_s | steady_p95_s | steady_p99_s |\n")
+            fh.write("|---|---|---:|---:|---:|---:|---:|---:|---:|\n")
+            for key, st in sorted(steady.items()):
+                w = warmup.get(key)
+                w_requests = w["requests"] if w else 0
+                w_p95 = f"{w['p95_s']:.6f}" if w else "-"
+                fh.write(
+                    f"| {key[0]} | {key[1]} | {key[2]} | {w_requests} | {st['requests']} | {w_p95} "
+                    f"| {st['p50_s']:.6f} | {st['p95_s']:.6f} | {st['p99_s']:.6f} |\n"
+                )
+
+            transport = transport_rows(records)
+            if transport:
+                fh.write("\n## Transport modes\n\n")
+                fh.write("`setup` is TCP connect + TLS handshake, `server` is time to first byte after setup. ")
+                fh.write("`saving_vs_fresh` is the P50 latency removed by reusing the connection. ")
+                fh.write("Rows marked `protocol_ok = no` did not negotiate the mode's HTTP version ")
+                fh.write("(e.g. `http2` against an HTTP/1.1 server) and are not compared.\n\n")
+                fh.write("| function_type | region | transport | http_version | protocol_ok | requests | connects | p50_s | p95_s | setup_p50_s | server_p50_s | saving_vs_fresh_p50_s |\n")
+                fh.write("|---|---|---|---|---|---:|---:|---:|---:|---:|---:|---:|\n")
+                fresh = {(t["function_type"], t["region"]): t for t in transport if t["transport"] == "fresh"}
+                for t in transport:
+                    f = fresh.get((t["function_type"], t["region"]))
+                    saving = f"{f['p50_s'] - t['p50_s']:.6f}" if f and f["protocol_ok"] and t["protocol_ok"] else "-"
+                    fh.write(
+                        f"| {t['function_type']} | {t['region']} | {t['transport']} | {t['http_version']} "
+                        f"| {'yes' if t['protocol_ok'] else 'no'} | {t['requests']} | {t['connects']} "
+                        f"| {t['p50_s']:.6f} | {t['p95_s']:.6f} | {t['setup_p50_s']:.6f} | {t['server_p50_s']:.6f} | {saving} |\n"
+                    )
+
+            fanout = [row for row in rows if row["scenario"] == "fanout" and "+" in row["region"]]
+            if fanout:
+                fh.write("\n## Fan-out\n\n")
+                fh.write("User-visible latency of one request sent to all regions. ")
+                fh.write("`first_N_of_M` is the latency when only the N fastest answers are needed (hedged requests).\n\n")
+                fh.write("| function_type | regions | statistic | fanouts | errors | p50_s | p95_s | p99_s | saving_vs_last_p95_s |\n")
+                fh.write("|---|---|---|---:|---:|---:|---:|---:|---:|\n")
+                last = {row["function_type"]: row for row in fanout if row["phase"] == "last"}
+                order = {"first": 0, "median": 2, "last": 3}
+                for row in sorted(fanout, key=lambda x: (x["function_type"], order.get(x["phase"], 1), x["phase"])):
+                    ref = last.get(row["function_type"])
+                    saving = f"{ref['p95_s'] - row['p95_s']:.6f}" if ref and ref["success"] and row["success"] else "-"
+                    fh.write(
+                        f"| {row['function_type']} | {row['region']} | {row['phase']} | {row['requests']} | {row['errors']} "
+                        f"| {row['p50_s']:.6f} | {row['p95_s']:.6f} | {row['p99_s']:.6f} | {saving} |\n"
+                    )
+
+            if resources:
+                fh.write("\n## Server resources\n\n")
+                fh.write("`cpu_util` is cores busy on average; I/O and context switches are deltas over the cell.\n\n")
+                headers = [
+                    "scenario", "phase", "function_type", "region", "concurrency", "requests", "cpu_util",
+                    "cpu_s_per_request", "rss_max_bytes", "read_bytes", "write_bytes", "ctx_voluntary", "ctx_involuntary",
+                ]
+                fh.write("| " + " | ".join(headers) + " |\n")
+                fh.write("|" + "|".join(["---"] * len(headers)) + "|\n")
+                for row in resources:
+                    fh.write("| " + " | ".join("-" if row[h] is None else str(row[h]) for h in headers) + " |\n")
+
     return summary_csv
 
 
@@ -455,6 +1278,12 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--config", default="benchmarks/config/endpoints.json")
     p.add_argument("--results-dir", default="benchmarks/results")
     p.add_argument("--tmp-dir", default="/tmp/srcnet-bench")
+    p.add_argument(
+        "--raw-format",
+        choices=sorted(RAW_WRITERS),
+        default="jsonl",
+        help="Raw record layout: jsonl (one object per request) or compact (per-cell constants stored once)",
+    )
     p.add_argument("--function-types", default="nohup,cpu_data", help="Comma list")
     p.add_argument("--regions", default="", help="Comma list")
     p.add_argument("--scenarios", default="baseline,concurrency,cold_warm", help="Comma list")
@@ -465,6 +1294,24 @@ def parse_args() -> argparse.Namespace:
 
     p.add_argument("--concurrency-levels", default="1,10,50")
     p.add_argument("--concurrency-duration", type=int, default=300)
+    p.add_argument(
+        "--warmup-detection",
+        choices=["mser5", "none"],
+        default="mser5",
+        help="Steady-state detection applied to each concurrency cell",
+    )
+
+    p.add_argument("--transport-modes", default=",".join(TRANSPORT_MODES), help="Comma list")
+    p.add_argument("--transport-requests", type=int, default=50, help="Requests per target and transport mode")
+    p.add_argument("--transport-streams", type=int, default=10, help="Concurrent HTTP/2 streams")
+
+    p.add_argument("--fanout-duration", type=int, default=120)
+    p.add_argument("--fanout-interval-min", type=float, default=1.0)
+    p.add_argument("--fanout-interval-max", type=float, default=2.0)
+
+    p.add_argument("--resource-pid", type=int, default=None, help="Sample /proc resources of this server PID")
+    p.add_argument("--resource-cgroup", default="", help="Sample resources of this cgroup v2 directory instead of a PID")
+    p.add_argument("--resource-interval", type=float, default=1.0, help="Resource sampling interval (s)")
 
     p.add_argument("--warm-interval", type=float, default=5.0)
     p.add_argument("--warm-duration", type=int, default=300)
@@ -515,7 +1362,12 @@ async def main_async(args: argparse.Namespace) -> int:
             local_source_url=args.local_source_url,
         )
 
-    remote_scenarios = {"baseline", "concurrency", "cold_warm"}
+    transport_modes = [x for x in args.transport_modes.split(",") if x]
+    unknown_modes = [m for m in transport_modes if m not in TRANSPORT_MODES]
+    if unknown_modes:
+        raise SystemExit(f"Unknown transport modes: {','.join(unknown_modes)}")
+
+    remote_scenarios = {"baseline", "concurrency", "cold_warm", "transport", "fanout"}
     wants_remote = any(s in scenario_set for s in remote_scenarios)
 
     if wants_remote and not selected:
@@ -527,62 +1379,131 @@ async def main_async(args: argparse.Namespace) -> int:
     if wants_remote and any(t.auth_required for t in selected) and not ska_token:
         raise SystemExit("SKA_TOKEN is required for non-local endpoints")
 
+    if args.resource_pid is not None and args.resource_cgroup:
+        raise SystemExit("Use either --resource-pid or --resource-cgroup, not both")
+    if args.resource_pid is not None and not Path(f"/proc/{args.resource_pid}/stat").exists():
+        raise SystemExit(f"--resource-pid {args.resource_pid}: no such process")
+    if args.resource_cgroup and not (Path(args.resource_cgroup) / "cpu.stat").is_file():
+        raise SystemExit(f"--resource-cgroup {args.resource_cgroup}: not a cgroup v2 directory")
+
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_dir = Path(args.results_dir) / run_id
     out_dir.mkdir(parents=True, exist_ok=True)
-    raw_path = out_dir / "raw.jsonl"
+    raw_path = out_dir / RAW_FILENAMES[args.raw_format]
 
     invoker = CurlInvoker(ska_token=ska_token, tmp_dir=Path(args.tmp_dir))
 
+    resources_path = None
+    resources_fh = None
+    sampler_task = None
+    if args.resource_pid is not None or args.resource_cgroup:
+        resources_path = out_dir / "resources.jsonl"
+        resources_fh = resources_path.open("w")
+        sampler = ResourceSampler(
+            sink=resources_fh,
+            interval_sec=args.resource_interval,
+            pid=args.resource_pid,
+            cgroup=Path(args.resource_cgroup) if args.resource_cgroup else None,
+        )
+        sampler_task = asyncio.create_task(sampler.run())
+
     total_requests = 0
 
-    with raw_path.open("w") as sink:
-        run_targets = list(selected)
-        if local_target is not None:
-            run_targets.append(local_target)
-
-        for target in run_targets:
-            run_local_baseline = (target.region == "local" and "local" in scenario_set)
-            if "baseline" in scenario_set or run_local_baseline:
-                total_requests += await run_baseline(
-                    invoker=invoker,
-                    target=target,
-                    duration_sec=args.local_duration if run_local_baseline else args.baseline_duration,
-                    interval_min=args.local_interval_min if run_local_baseline else args.baseline_interval_min,
-                    interval_max=args.local_interval_max if run_local_baseline else args.baseline_interval_max,
-                    scenario_name="local" if run_local_baseline else "baseline",
-                    sink=sink,
-                )
+    try:
+        with raw_path.open("w") as fh:
+            sink = RAW_WRITERS[args.raw_format](fh)
+            run_targets = list(selected)
+            if local_target is not None:
+                run_targets.append(local_target)
+
+            for target in run_targets:
+                run_local_baseline = (target.region == "local" and "local" in scenario_set)
+                if "baseline" in scenario_set or run_local_baseline:
+                    total_requests += await run_baseline(
+                        invoker=invoker,
+                        target=target,
+                        duration_sec=args.local_duration if run_local_baseline else args.baseline_duration,
+                        interval_min=args.local_interval_min if run_local_baseline else args.baseline_interval_min,
+                        interval_max=args.local_interval_max if run_local_baseline else args.baseline_interval_max,
+                        scenario_name="local" if run_local_baseline else "baseline",
+                        sink=sink,
+                    )
 
-            if "concurrency" in scenario_set:
-                for c in [int(x) for x in args.concurrency_levels.split(",") if x]:
-                    total_requests += await run_concurrency(
+                if "concurrency" in scenario_set:
+                    for c in [int(x) for x in args.concurrency_levels.split(",") if x]:
+                        total_requests += await run_concurrency(
+                            invoker=invoker,
+                            target=target,
+                            concurrency=c,
+                            duration_sec=args.concurrency_duration,
+                            sink=sink,
+                        )
+
+                if "transport" in scenario_set:
+                    total_requests += await run_transport(
                         invoker=invoker,
                         target=target,
-                        concurrency=c,
-                        duration_sec=args.concurrency_duration,
+                        modes=transport_modes,
+                        requests_per_mode=args.transport_requests,
+                        streams=args.transport_streams,
                         sink=sink,
                     )
 
-            if "cold_warm" in scenario_set:
-                total_requests += await run_cold_warm(
-                    invoker=invoker,
-                    target=target,
-                    warm_interval_sec=args.warm_interval,
-                    warm_duration_sec=args.warm_duration,
-                    idle_minutes=[int(x) for x in args.idle_minutes.split(",") if x],
-                    cold_repeats=args.cold_repeats,
-                    do_idle_wait=not args.skip_idle_wait,
-                    sink=sink,
-                )
+                if "cold_warm" in scenario_set:
+                    total_requests += await run_cold_warm(
+                        invoker=invoker,
+                        target=target,
+                        warm_interval_sec=args.warm_interval,
+                        warm_duration_sec=args.warm_duration,
+                        idle_minutes=[int(x) for x in args.idle_minutes.split(",") if x],
+                        cold_repeats=args.cold_repeats,
+                        do_idle_wait=not args.skip_idle_wait,
+                        sink=sink,
+                    )
 
-    records = []
-    with raw_path.open() as fh:
-        for line in fh:
-            if line.strip():
-                records.append(json.loads(line))
+            if "fanout" in scenario_set:
+                by_function_type: Dict[str, List[EndpointTarget]] = {}
+                for target in run_targets:
+                    by_function_type.setdefault(target.function_type, []).append(target)
+                for function_type, fanout_targets in by_function_type.items():
+                    if len(fanout_targets) < 2:
+                        print(f"Skipping fanout for {function_type}: needs at least 2 regions", file=sys.stderr)
+                        continue
+                    total_requests += await run_fanout(
+                        invoker=invoker,
+                        targets=fanout_targets,
+                        duration_sec=args.fanout_duration,
+                        interval_min=args.fanout_interval_min,
+                        interval_max=args.fanout_interval_max,
+                        sink=sink,
+                    )
+    finally:
+        if sampler_task is not None:
+            # Take one last sample so the final cell has a closing data point.
+            rec = await asyncio.to_thread(sampler.sample)
+            sampler_task.cancel()
+            try:
+                await sampler_task
+            except asyncio.CancelledError:
+                pass
+            if rec is not None:
+                resources_fh.write(json.dumps(rec) + "\n")
+            resources_fh.close()
+
+    resource_samples = load_resource_samples(resources_path) if resources_path is not None else None
+
+    records = load_records(raw_path)
+    # Records are streamed during the run; warm-up tags are added once every cell is complete.
+    warmup_cutoffs = tag_warmup(records, args.warmup_detection)
+    if warmup_cutoffs:
+        tagged_path = raw_path.with_name(raw_path.name + ".tmp")
+        with tagged_path.open("w") as fh:
+            writer = RAW_WRITERS[args.raw_format](fh)
+            for rec in records:
+                writer.write_record(rec)
+        tagged_path.replace(raw_path)
 
-    summary_csv = summarize(records, out_dir)
+    summary_csv = summarize(records, out_dir, resource_samples, args.warmup_detection)
 
     meta = {
         "run_id": run_id,
@@ -592,7 +1513,10 @@ async def main_async(args: argparse.Namespace) -> int:
         "args": vars(args),
         "raw": str(raw_path),
         "summary": str(summary_csv),
+        "warmup_cutoffs": warmup_cutoffs,
     }
+    if resources_path is not None:
+        meta["resources"] = str(resources_path)
     (out_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
     print(json.dumps(meta, indent=2))
     return 0